@@ -1,24 +1,26 @@
 from __future__ import annotations
 
-from functools import lru_cache
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Tuple
 from uuid import UUID
 
-from fastapi import Depends, HTTPException, status
+from fastapi import Depends, Request
 from fastapi.security import OAuth2PasswordBearer
 
+from common.cache import TTLCache
 from common.config import ConfigError, get_settings
-from common.errors import ValidationError
+from common.errors import UnauthorizedError, ValidationError, to_http_exception
 from common.jwt_utils import decode_access_token
 from common.openai_client import OpenAIClient, OpenAIClientConfig
-from common.time_utils import from_isoformat
 from repositories.sheets_repo import SheetsRepository, create_client
-from schemas.auth import UserOut, UserRole
+from repositories.write_buffer import WriteBuffer
+from schemas.auth import UserOut
 from services.auth_service import AuthService
-from services.children_service import ChildrenService
+from services.children_service import ChildrenService, new_child_detail_cache
+from services.row_models import user_out_from_row
 from services.sessions_service import SessionsService
 
 
-@lru_cache()
 def _build_openai_client() -> OpenAIClient:
     settings = get_settings()
     if not settings.openai.api_key:
@@ -28,7 +30,6 @@ def _build_openai_client() -> OpenAIClient:
     return OpenAIClient(config)
 
 
-@lru_cache()
 def _build_sheets_repository() -> SheetsRepository:
     settings = get_settings()
     spreadsheet_id = settings.google_sheets.spreadsheet_id
@@ -36,56 +37,136 @@ def _build_sheets_repository() -> SheetsRepository:
         raise ConfigError("GOOGLE_SHEETS_SPREADSHEET_ID is not configured.")
 
     client = create_client(settings.google_sheets.credentials_path)
-    return SheetsRepository(client=client, spreadsheet_id=spreadsheet_id)
+    return SheetsRepository(
+        client=client,
+        spreadsheet_id=spreadsheet_id,
+        requests_per_second=settings.google_sheets.requests_per_second,
+        burst=settings.google_sheets.burst,
+    )
 
 
-def get_children_service() -> ChildrenService:
-    return ChildrenService(
-        repository=_build_sheets_repository(),
-        openai_client=_build_openai_client(),
-    )
+CURRENT_USER_CACHE_TTL_SECONDS = 60.0
+
+# user_id -> UserOut, shared with AuthService so logins drop stale entries
+_current_user_cache: TTLCache[str, UserOut] = TTLCache(
+    maxsize=1024, ttl=CURRENT_USER_CACHE_TTL_SECONDS
+)
+
+
+@dataclass(frozen=True)
+class Services:
+    """Process-wide clients and services, built once at startup."""
+
+    repository: SheetsRepository
+    openai_client: OpenAIClient
+    auth: AuthService
+    children: ChildrenService
+    sessions: SessionsService
+    writers: Tuple[WriteBuffer[Any], ...] = ()
+
+    def start(self) -> None:
+        for writer in self.writers:
+            writer.start()
 
+    async def aclose(self) -> None:
+        # flush buffered rows before the process exits
+        for writer in self.writers:
+            await writer.stop()
+        self.repository.close()
+        await self.openai_client.aclose()
 
-def get_sessions_service() -> SessionsService:
-    return SessionsService(
-        repository=_build_sheets_repository(),
-        openai_client=_build_openai_client(),
+
+def build_services() -> Services:
+    repository = _build_sheets_repository()
+    openai_client = _build_openai_client()
+    child_writer: WriteBuffer[Tuple[Dict[str, Any], Dict[str, Any]]] = WriteBuffer(
+        repository.create_children_and_links_bulk, run=repository.run
     )
+    child_cache = new_child_detail_cache()
+    session_writer: WriteBuffer[Dict[str, Any]] = WriteBuffer(
+        repository.create_sessions_bulk, run=repository.run
+    )
+
+    return Services(
+        repository=repository,
+        openai_client=openai_client,
+        auth=AuthService(repository=repository, user_cache=_current_user_cache),
+        children=ChildrenService(
+            repository=repository,
+            openai_client=openai_client,
+            child_writer=child_writer,
+            child_cache=child_cache,
+        ),
+        sessions=SessionsService(
+            repository=repository,
+            openai_client=openai_client,
+            session_writer=session_writer,
+            child_cache=child_cache,
+        ),
+        writers=(child_writer, session_writer),
+    )
+
+
+async def get_auth_service(request: Request) -> AuthService:
+    return request.app.state.services.auth
 
 
-oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
+async def get_children_service(request: Request) -> ChildrenService:
+    return request.app.state.services.children
 
 
-def get_auth_service() -> AuthService:
-    return AuthService(repository=_build_sheets_repository())
+async def get_sessions_service(request: Request) -> SessionsService:
+    return request.app.state.services.sessions
 
 
-def get_current_user(token: str = Depends(oauth2_scheme)) -> UserOut:
+oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login", auto_error=False)
+
+
+def user_id_from_token(token: str) -> UUID:
+    """Decode a bearer token to its user id, raising UnauthorizedError on failure."""
     try:
         payload = decode_access_token(token)
     except ValidationError as exc:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"code": "unauthorized", "message": "Invalid authentication token."},
-        ) from exc
+        raise UnauthorizedError("Invalid authentication token.") from exc
 
-    repository = _build_sheets_repository()
-    user_uuid = UUID(payload.sub)
-    record = repository.get_user_by_id(str(user_uuid))
+    # tokens carry the hex form of the id while the sheet stores the dashed form
+    try:
+        return UUID(payload.sub)
+    except ValueError as exc:
+        raise UnauthorizedError("Invalid authentication token.") from exc
+
+
+async def load_current_user(user_uuid: UUID, repository: SheetsRepository) -> UserOut:
+    """Fetch the user behind a decoded token, raising UnauthorizedError if it is gone."""
+    user_id = str(user_uuid)
+    cached = _current_user_cache.get(user_id)
+    if cached is not None:
+        return cached
+
+    # only the gspread lookup is blocking; token decoding stays on the loop
+    record = await repository.run(repository.get_user_by_id, user_id)
     if record is None:
-        raise HTTPException(
-            status_code=status.HTTP_401_UNAUTHORIZED,
-            detail={"code": "unauthorized", "message": "User not found."},
-        )
-
-    return UserOut(
-        user_id=user_uuid,
-        email=record["email"],
-        full_name=record["full_name"],
-        role=UserRole(record["role"]),
-        created_at=from_isoformat(record["created_at"]),
-        updated_at=from_isoformat(record["updated_at"]),
-        last_login_at=from_isoformat(record["last_login_at"])
-        if record.get("last_login_at")
-        else None,
-    )
+        raise UnauthorizedError("User not found.")
+
+    user = user_out_from_row(record)
+    _current_user_cache.set(user_id, user)
+    return user
+
+
+async def get_current_user(
+    request: Request, token: Optional[str] = Depends(oauth2_scheme)
+) -> UserOut:
+    """Resolve the bearer token into the current user.
+
+    Only this dependency touches Sheets, so public routes never pay for a
+    user lookup.
+    """
+    try:
+        if token is None:
+            raise UnauthorizedError("Not authenticated.")
+        user_uuid = user_id_from_token(token)
+        return await load_current_user(user_uuid, request.app.state.services.repository)
+    except UnauthorizedError as error:
+        exc = to_http_exception(error)
+        exc.headers = {"WWW-Authenticate": "Bearer"}
+        raise exc from error
@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from uuid import UUID
+
+from fastapi import APIRouter, Depends, status
 
 from api.dependencies import get_sessions_service, get_current_user
 from common.errors import BaseAppError, to_http_exception
@@ -32,18 +34,10 @@ async def create_session(
     response_model=SessionDetail,
 )
 async def get_session(
-    session_id: str,
+    session_id: UUID,
     service: SessionsService = Depends(get_sessions_service),
 ) -> SessionDetail:
-    from uuid import UUID
-
     try:
-        return await service.get_session(UUID(session_id))
-    except ValueError:
-        # Path param is not a valid UUID
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid session_id format.",
-        )
+        return await service.get_session(session_id)
     except BaseAppError as exc:
         raise to_http_exception(exc)
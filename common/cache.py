@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+import threading
+import time
+from collections import OrderedDict
+from typing import Generic, Hashable, Optional, Tuple, TypeVar
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """Thread-safe LRU cache whose entries expire after a time-to-live."""
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        if maxsize <= 0:
+            raise ValueError("maxsize must be positive.")
+        if ttl <= 0:
+            raise ValueError("ttl must be positive.")
+
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._data: "OrderedDict[K, Tuple[float, V]]" = OrderedDict()
+        # repository calls run in worker threads, so guard every mutation
+        self._lock = threading.Lock()
+
+    def get(self, key: K) -> Optional[V]:
+        """Return the cached value, or None if it is missing or expired."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is None:
+                return None
+
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._data[key]
+                return None
+
+            self._data.move_to_end(key)
+            return value
+
+    def set(self, key: K, value: V, *, ttl: Optional[float] = None) -> None:
+        """Store a value, optionally overriding the default time-to-live."""
+        expires_at = time.monotonic() + (self._ttl if ttl is None else ttl)
+        with self._lock:
+            self._data[key] = (expires_at, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self._maxsize:
+                self._data.popitem(last=False)
+
+    def pop(self, key: K) -> Optional[V]:
+        """Remove a key and return its value if it was still cached."""
+        with self._lock:
+            entry = self._data.pop(key, None)
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+    def clear(self) -> None:
+        with self._lock:
+            self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
@@ -1,11 +1,11 @@
 from __future__ import annotations
 
+import hashlib
 import os
 import tempfile
 from dataclasses import dataclass
-from functools import lru_cache
 from pathlib import Path
-from typing import Optional
+from typing import Optional, Tuple
 
 
 class ConfigError(RuntimeError):
@@ -16,6 +16,9 @@ class ConfigError(RuntimeError):
 class GoogleSheetsSettings:
     credentials_path: Path
     spreadsheet_id: Optional[str]
+    # pacing for Sheets API calls; keep under the per-user quota
+    requests_per_second: float = 5.0
+    burst: int = 20
 
 
 @dataclass(frozen=True)
@@ -32,12 +35,24 @@ class JWTSettings:
     access_token_minutes: int
 
 
+@dataclass(frozen=True)
+class PasswordSettings:
+    bcrypt_rounds: int
+
+
+@dataclass(frozen=True)
+class CORSSettings:
+    allow_origins: Tuple[str, ...]
+
+
 @dataclass(frozen=True)
 class Settings:
     environment: str
     google_sheets: GoogleSheetsSettings
     openai: OpenAISettings
     jwt: JWTSettings
+    passwords: PasswordSettings
+    cors: CORSSettings
 
 
 def _read_required_path(env_name: str) -> Path:
@@ -74,6 +89,34 @@ def _read_int(env_name: str, default: int) -> int:
         raise ConfigError(f"{env_name} must be an integer.") from exc
 
 
+def _read_float(env_name: str, default: float) -> float:
+    raw = _read_optional(env_name)
+    if raw is None:
+        return default
+    try:
+        return float(raw)
+    except ValueError as exc:
+        raise ConfigError(f"{env_name} must be a number.") from exc
+
+
+def _read_bcrypt_rounds() -> int:
+    rounds = _read_int("BCRYPT_ROUNDS", 12)
+    if not (4 <= rounds <= 31):
+        raise ConfigError("BCRYPT_ROUNDS must be between 4 and 31.")
+    return rounds
+
+
+def _read_cors_origins() -> Tuple[str, ...]:
+    """Comma-separated CORS_ALLOW_ORIGINS; unset keeps the permissive "*"."""
+    raw = _read_optional("CORS_ALLOW_ORIGINS")
+    if raw is None:
+        return ("*",)
+    origins = tuple(origin.strip().rstrip("/") for origin in raw.split(",") if origin.strip())
+    if not origins:
+        raise ConfigError("CORS_ALLOW_ORIGINS must list at least one origin.")
+    return origins
+
+
 def _resolve_google_credentials_path() -> Path:
     """
     Render deployments provide the service account JSON via an env var.
@@ -84,14 +127,35 @@ def _resolve_google_credentials_path() -> Path:
     if credentials_json:
         tmp_dir = Path(tempfile.gettempdir())
         tmp_path = tmp_dir / "google_sheets_credentials.json"
-        tmp_path.write_text(credentials_json)
+        content = credentials_json.encode()
+        # workers and reloads share the file; skip the write if it is unchanged
+        if tmp_path.exists():
+            current_digest = hashlib.sha256(tmp_path.read_bytes()).digest()
+            if current_digest == hashlib.sha256(content).digest():
+                return tmp_path
+
+        # write-then-rename so concurrent readers never see a partial file
+        staging_path = tmp_path.with_name(f"{tmp_path.name}.{os.getpid()}.tmp")
+        staging_path.write_bytes(content)
+        os.replace(staging_path, tmp_path)
         return tmp_path
 
     return _read_required_path("GOOGLE_SHEETS_CREDENTIALS_PATH")
 
 
-@lru_cache()
+_settings: Optional[Settings] = None
+
+
 def get_settings() -> Settings:
+    """Return the process-wide settings, loading them on first use."""
+    # plain global instead of lru_cache: this runs on every authenticated request
+    global _settings
+    if _settings is None:
+        _settings = _load_settings()
+    return _settings
+
+
+def _load_settings() -> Settings:
     """Load application settings from environment variables."""
     credentials_path = _resolve_google_credentials_path()
 
@@ -100,6 +164,8 @@ def get_settings() -> Settings:
         google_sheets=GoogleSheetsSettings(
             credentials_path=credentials_path,
             spreadsheet_id=_read_optional("GOOGLE_SHEETS_SPREADSHEET_ID"),
+            requests_per_second=_read_float("GOOGLE_SHEETS_REQUESTS_PER_SECOND", 5.0),
+            burst=_read_int("GOOGLE_SHEETS_BURST", 20),
         ),
         openai=OpenAISettings(api_key=_read_optional("OPENAI_API_KEY")),
         jwt=JWTSettings(
@@ -109,4 +175,6 @@ def get_settings() -> Settings:
             audience=_read_optional("JWT_AUDIENCE"),
             access_token_minutes=_read_int("JWT_ACCESS_TOKEN_MINUTES", 60),
         ),
+        passwords=PasswordSettings(bcrypt_rounds=_read_bcrypt_rounds()),
+        cors=CORSSettings(allow_origins=_read_cors_origins()),
     )
@@ -0,0 +1,17 @@
+from __future__ import annotations
+
+import os
+from uuid import UUID
+
+# clear the version/variant fields, then stamp version 4 and the RFC 4122 variant
+_V4_CLEAR = ~((0xF000 << 64) | (0xC000 << 48))
+_V4_SET = (4 << 76) | (0x8000 << 48)
+
+
+def new_uuid4() -> UUID:
+    """Random (version 4) UUID, equivalent to uuid.uuid4().
+
+    Masks the random integer directly instead of going through
+    UUID(bytes=..., version=4), which converts and re-validates twice.
+    """
+    return UUID(int=(int.from_bytes(os.urandom(16), "big") & _V4_CLEAR) | _V4_SET)
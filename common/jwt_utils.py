@@ -1,17 +1,26 @@
 from __future__ import annotations
 
+import hashlib
+import json
+import time
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Literal, Optional
+from functools import lru_cache
+from typing import Any, Literal, Optional, Tuple
 
 import jwt
 from jwt import InvalidTokenError
+from jwt.algorithms import Algorithm, get_default_algorithms
+from jwt.utils import base64url_encode
 
+from common.cache import TTLCache
 from common.config import JWTSettings, get_settings
 from common.errors import ValidationError
 
 RoleLiteral = Literal["parent", "therapist"]
 
+DECODE_CACHE_MAXSIZE = 4096
+
 
 @dataclass(frozen=True)
 class JWTPayload:
@@ -24,10 +33,42 @@ class JWTPayload:
     aud: Optional[str] = None
 
 
+# token digest + settings -> payload; entries expire together with the token
+_decode_cache: TTLCache[Tuple[bytes, JWTSettings], "JWTPayload"] = TTLCache(
+    maxsize=DECODE_CACHE_MAXSIZE, ttl=3600
+)
+
+
 def _ensure_settings(settings: Optional[JWTSettings]) -> JWTSettings:
     return settings or get_settings().jwt
 
 
+@dataclass(frozen=True)
+class _Signer:
+    algorithm: Algorithm
+    key: Any
+    header_segment: bytes
+
+
+@lru_cache(maxsize=8)
+def _get_signer(jwt_settings: JWTSettings) -> _Signer:
+    """Prepare the signing key and encoded header once per settings object."""
+    try:
+        algorithm = get_default_algorithms()[jwt_settings.algorithm]
+    except KeyError as exc:
+        raise ValidationError(
+            message=f"Unsupported JWT algorithm: {jwt_settings.algorithm}"
+        ) from exc
+
+    header = {"alg": jwt_settings.algorithm, "typ": "JWT"}
+    header_json = json.dumps(header, separators=(",", ":")).encode()
+    return _Signer(
+        algorithm=algorithm,
+        key=algorithm.prepare_key(jwt_settings.secret_key),
+        header_segment=base64url_encode(header_json),
+    )
+
+
 def create_access_token(
     *,
     user_id: str,
@@ -54,12 +95,30 @@ def create_access_token(
     if jwt_settings.audience:
         payload["aud"] = jwt_settings.audience
 
-    return jwt.encode(payload, jwt_settings.secret_key, algorithm=jwt_settings.algorithm)
+    # same compact JWS that jwt.encode produces, minus the per-call key/header setup
+    signer = _get_signer(jwt_settings)
+    payload_segment = base64url_encode(json.dumps(payload, separators=(",", ":")).encode())
+    signing_input = signer.header_segment + b"." + payload_segment
+    signature = signer.algorithm.sign(signing_input, signer.key)
+    return (signing_input + b"." + base64url_encode(signature)).decode("ascii")
 
 
 def decode_access_token(token: str, *, settings: Optional[JWTSettings] = None) -> JWTPayload:
     """Validate and decode a JWT, returning the canonical payload."""
     jwt_settings = _ensure_settings(settings)
+    cache_key = (hashlib.blake2b(token.encode(), digest_size=16).digest(), jwt_settings)
+    cached = _decode_cache.get(cache_key)
+    if cached is not None and cached.exp > time.time():
+        return cached
+
+    payload = _decode_uncached(token, jwt_settings)
+    remaining = payload.exp - time.time()
+    if remaining > 0:
+        _decode_cache.set(cache_key, payload, ttl=remaining)
+    return payload
+
+
+def _decode_uncached(token: str, jwt_settings: JWTSettings) -> JWTPayload:
     options = {"require": ["sub", "email", "role", "iat", "exp"]}
     try:
         decoded = jwt.decode(
@@ -0,0 +1,43 @@
+from __future__ import annotations
+
+import hashlib
+import re
+from typing import Optional
+
+from common.cache import TTLCache
+
+_PHRASE_SEPARATOR_RE = re.compile(r"[,;\n]+")
+_WHITESPACE_RE = re.compile(r"\s+")
+_EDGE_PUNCTUATION = " .!?\"'"
+
+
+def canonical_keyword_text(raw_text: str) -> str:
+    """Reduce raw notes to a canonical form for cache lookups.
+
+    Case, runs of whitespace, the choice of phrase separator and stray
+    punctuation around phrases do not change the extracted keywords, so
+    "Loud noises;  trains." and "loud noises, trains" map to the same text.
+    """
+    phrases = (
+        _WHITESPACE_RE.sub(" ", phrase).strip(_EDGE_PUNCTUATION)
+        for phrase in _PHRASE_SEPARATOR_RE.split(raw_text.casefold())
+    )
+    return ", ".join(phrase for phrase in phrases if phrase)
+
+
+class KeywordCache:
+    """Formatted keyword strings keyed by label and canonicalized input text."""
+
+    def __init__(self, *, maxsize: int, ttl: float) -> None:
+        self._entries: TTLCache[bytes, str] = TTLCache(maxsize=maxsize, ttl=ttl)
+
+    @staticmethod
+    def _key(label: str, raw_text: str) -> bytes:
+        canonical = canonical_keyword_text(raw_text)
+        return hashlib.sha256(f"{label}\0{canonical}".encode()).digest()
+
+    def get(self, label: str, raw_text: str) -> Optional[str]:
+        return self._entries.get(self._key(label, raw_text))
+
+    def set(self, label: str, raw_text: str, keywords: str) -> None:
+        self._entries.set(self._key(label, raw_text), keywords)
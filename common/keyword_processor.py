@@ -1,14 +1,35 @@
 from __future__ import annotations
 
+import json
 from dataclasses import dataclass
-from typing import Awaitable, Callable, Iterable, List
+from typing import Awaitable, Callable, Iterable, List, Optional, Sequence
 
-from common.errors import ValidationError
+from common.errors import ExternalServiceError, ValidationError
+from common.keyword_cache import KeywordCache
 
 KEYWORD_DELIMITER = ","
 KEYWORD_MIN = 1
 KEYWORD_MAX = 7
 
+# static parts of the keyword prompt; only the label and input text vary
+_PROMPT_PREFIX = (
+    "You are an assistant that extracts concise, lowercase keywords from parental notes.\n"
+    "Return between 1 and 7 keywords separated by commas. Replace spaces with underscores.\n"
+    "Label: "
+)
+_PROMPT_MID = (
+    "\n"
+    "The value after “Label:” only tells you the keyword category, do not include the label itself or any prefix in the output.\n"
+    "Input text:\n"
+)
+_BATCH_PROMPT_PREFIX = (
+    "You are an assistant that extracts concise, lowercase keywords from parental notes.\n"
+    "For every item below, return between 1 and 7 keywords separated by commas. Replace spaces with underscores.\n"
+    "An item's label only tells you the keyword category, do not include the label itself or any prefix in the output.\n"
+    "Respond with a JSON object mapping each item id to its keyword string.\n"
+    "Items:\n"
+)
+
 
 @dataclass(frozen=True)
 class KeywordRequest:
@@ -19,15 +40,9 @@ class KeywordRequest:
 
 
 def _normalize_tokens(tokens: Iterable[str]) -> List[str]:
-    normalized: List[str] = []
-    for token in tokens:
-        cleaned = token.strip().lower().replace(" ", "_")
-        if not cleaned:
-            continue
-        if cleaned in normalized:
-            continue
-        normalized.append(cleaned)
-    return normalized
+    cleaned = (token.strip().lower().replace(" ", "_") for token in tokens)
+    # dict keeps first-seen order while making duplicate checks O(1)
+    return list(dict.fromkeys(token for token in cleaned if token))
 
 
 def _validate_token_count(tokens: List[str], *, label: str) -> None:
@@ -48,40 +63,81 @@ def format_keywords(tokens: Iterable[str]) -> str:
     return KEYWORD_DELIMITER.join(normalized)
 
 
-# async prompt -> keyword string returned by LLM client
-KeywordGenerator = Callable[[str], Awaitable[str]]
+# async requests -> raw keyword strings returned by LLM client, in the same order
+KeywordGenerator = Callable[[Sequence[KeywordRequest]], Awaitable[List[str]]]
 
 
 class KeywordProcessor:
     """High level helper for generating and formatting keyword strings."""
 
-    def __init__(self, generator: KeywordGenerator) -> None:
+    def __init__(
+        self, generator: KeywordGenerator, *, cache: Optional[KeywordCache] = None
+    ) -> None:
         self._generate = generator
+        self._cache = cache
 
     async def process(self, request: KeywordRequest) -> str:
         """Generate processed keywords from raw text."""
-        raw = request.raw_text.strip()
-        if not raw:
-            raise ValidationError(
-                message=f"{request.label}_raw cannot be empty.", details={"label": request.label}
-            )
-
-        prompt = self._build_prompt(request)
-        response = await self._generate(prompt)
-        tokens = self._parse_response(response, label=request.label)
-        return format_keywords(tokens)
-
-    def _build_prompt(self, request: KeywordRequest) -> str:
+        (keywords,) = await self.process_many((request,))
+        return keywords
+
+    async def process_many(self, requests: Sequence[KeywordRequest]) -> List[str]:
+        """Generate processed keywords for one caller's requests.
+
+        Cached requests are answered directly; the rest go to the generator
+        in a single call.
+        """
+        results: List[Optional[str]] = []
+        for request in requests:
+            raw = request.raw_text.strip()
+            if not raw:
+                raise ValidationError(
+                    message=f"{request.label}_raw cannot be empty.",
+                    details={"label": request.label},
+                )
+            results.append(self._cache.get(request.label, raw) if self._cache is not None else None)
+
+        missing = [index for index, result in enumerate(results) if result is None]
+        if missing:
+            responses = await self._generate([requests[index] for index in missing])
+            if len(responses) != len(missing):
+                raise ExternalServiceError(
+                    message="Keyword generation returned the wrong number of results.",
+                    details={"expected": len(missing), "received": len(responses)},
+                )
+            for index, response in zip(missing, responses):
+                request = requests[index]
+                keywords = self.format_response(response, label=request.label)
+                if self._cache is not None:
+                    self._cache.set(request.label, request.raw_text.strip(), keywords)
+                results[index] = keywords
+
+        # callers pair results with their requests by position, so no slot may be empty
+        keywords_list: List[str] = []
+        for request, result in zip(requests, results):
+            if result is None:
+                raise ExternalServiceError(
+                    message="Keyword generation left a label without a result.",
+                    details={"label": request.label},
+                )
+            keywords_list.append(result)
+        return keywords_list
+
+    def build_prompt(self, request: KeywordRequest) -> str:
         """Craft the instruction prompt for the LLM."""
-        instructions = (
-            "You are an assistant that extracts concise, lowercase keywords from parental notes.\n"
-            "Return between 1 and 7 keywords separated by commas. Replace spaces with underscores.\n"
-            f"Label: {request.label}\n"
-            "The value after “Label:” only tells you the keyword category, do not include the label itself or any prefix in the output.\n"
-            "Input text:\n"
-            f"{request.raw_text.strip()}"
-        )
-        return instructions
+        return "".join((_PROMPT_PREFIX, request.label, _PROMPT_MID, request.raw_text.strip()))
+
+    def build_batch_prompt(self, requests: Sequence[KeywordRequest]) -> str:
+        """Craft one prompt covering one caller's requests; item ids are list positions."""
+        items = [
+            {"id": str(index), "label": request.label, "text": request.raw_text.strip()}
+            for index, request in enumerate(requests)
+        ]
+        return _BATCH_PROMPT_PREFIX + json.dumps(items, ensure_ascii=False)
+
+    def format_response(self, response: str, *, label: str) -> str:
+        """Turn a raw LLM response into the canonical keyword string."""
+        return format_keywords(self._parse_response(response, label=label))
 
     def _parse_response(self, response: str, *, label: str) -> List[str]:
         """Convert the LLM response string into a list of tokens."""
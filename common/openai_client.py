@@ -1,23 +1,44 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import ssl
 from dataclasses import dataclass
-from typing import Any, Dict, Iterable, Optional, Sequence
+from typing import Any, Dict, Iterable, List, Optional, Sequence
 
+import httpx
 from openai import AsyncOpenAI
 from openai.types.chat import ChatCompletionMessageParam
 
 from common.errors import ExternalServiceError, ValidationError
+from common.keyword_cache import KeywordCache
 from common.keyword_processor import KeywordRequest, KeywordProcessor
+from common.rate_limit import RateLimiter
 
 DEFAULT_KEYWORD_MODEL = "gpt-4o-mini"
 DEFAULT_PROMPT_MODEL = "gpt-4o"
 
+KEYWORD_TEMPERATURE = 0.2
+KEYWORD_MAX_OUTPUT_TOKENS = 120
+KEYWORD_CACHE_MAXSIZE = 10_000
+KEYWORD_CACHE_TTL_SECONDS = 24 * 60 * 60
+
+# Building an SSL context costs milliseconds, so every HTTP client shares one.
+_SHARED_SSL_CONTEXT = ssl.create_default_context()
+HTTP_TIMEOUT = httpx.Timeout(connect=3.0, read=30.0, write=5.0, pool=2.0)
+HTTP_LIMITS = httpx.Limits(max_connections=100, max_keepalive_connections=50)
+# upper bound for one call including the SDK's own retries
+REQUEST_DEADLINE_SECONDS = 35.0
+
 
 @dataclass(frozen=True)
 class OpenAIClientConfig:
     api_key: str
     keyword_model: str = DEFAULT_KEYWORD_MODEL
     prompt_model: str = DEFAULT_PROMPT_MODEL
+    # pacing for outbound completions; keep under the account's RPM limit
+    requests_per_second: float = 50.0
+    burst: int = 50
 
 
 class OpenAIClient:
@@ -28,16 +49,27 @@ class OpenAIClient:
             raise ValidationError("OPENAI_API_KEY is missing or empty.")
 
         self._config = config
-        self._client = AsyncOpenAI(api_key=config.api_key)
-        self._keyword_processor = KeywordProcessor(self._generate_keyword_completion)
+        # one pooled HTTP client per OpenAIClient, closed by aclose() at shutdown
+        self._http_client = httpx.AsyncClient(
+            verify=_SHARED_SSL_CONTEXT, timeout=HTTP_TIMEOUT, limits=HTTP_LIMITS
+        )
+        self._client = AsyncOpenAI(api_key=config.api_key, http_client=self._http_client)
+        # repeated notes (up to case, spacing and separators) skip the completion call
+        self._keyword_processor = KeywordProcessor(
+            self._generate_keyword_texts,
+            cache=KeywordCache(maxsize=KEYWORD_CACHE_MAXSIZE, ttl=KEYWORD_CACHE_TTL_SECONDS),
+        )
+        self._limiter = RateLimiter(rate=config.requests_per_second, capacity=config.burst)
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP connections."""
+        await self._http_client.aclose()
 
     async def generate_keywords(self, requests: Sequence[KeywordRequest]) -> Dict[str, str]:
         """Generate normalized keyword strings for multiple raw text requests."""
-        results: Dict[str, str] = {}
-        for request in requests:
-            processed = await self._keyword_processor.process(request)
-            results[request.label] = processed
-        return results
+        # every label of one caller's request shares a single completion
+        processed = await self._keyword_processor.process_many(requests)
+        return {request.label: result for request, result in zip(requests, processed)}
 
     async def generate_prompt(
         self,
@@ -51,27 +83,83 @@ class OpenAIClient:
         ]
         messages.extend(template_messages)
 
+        await self._limiter.acquire()
         try:
-            completion = await self._client.chat.completions.create(
-                model=self._config.prompt_model,
-                messages=messages,
-                temperature=0.3,
-                max_tokens=800,
+            completion = await asyncio.wait_for(
+                self._client.chat.completions.create(
+                    model=self._config.prompt_model,
+                    messages=messages,
+                    temperature=0.3,
+                    max_tokens=800,
+                ),
+                timeout=REQUEST_DEADLINE_SECONDS,
             )
+        except asyncio.TimeoutError as exc:
+            raise ExternalServiceError("Timed out generating session prompt.") from exc
         except Exception as exc:
             raise ExternalServiceError("Failed to generate session prompt.") from exc
 
         return self._extract_message_text(completion.choices[0].message.content)
 
-    async def _generate_keyword_completion(self, prompt: str) -> str:
+    async def _generate_keyword_texts(self, requests: Sequence[KeywordRequest]) -> List[str]:
+        """Answer one caller's keyword requests with a single completion.
+
+        Requests from different callers are never combined, so one user's notes
+        cannot leak into or steer another user's keywords.
+        """
+        if len(requests) == 1:
+            prompt = self._keyword_processor.build_prompt(requests[0])
+            return [await self._generate_keyword_completion(prompt)]
+
+        text = await self._generate_keyword_completion(
+            self._keyword_processor.build_batch_prompt(requests),
+            max_output_tokens=KEYWORD_MAX_OUTPUT_TOKENS * len(requests),
+            json_output=True,
+        )
+        try:
+            answers = json.loads(text)
+        except ValueError as exc:
+            raise ExternalServiceError("OpenAI keyword batch response was not valid JSON.") from exc
+        if not isinstance(answers, dict):
+            raise ExternalServiceError("OpenAI keyword batch response was not a JSON object.")
+
+        results: List[str] = []
+        for index, request in enumerate(requests):
+            answer = answers.get(str(index))
+            if not isinstance(answer, str) or not answer.strip():
+                raise ExternalServiceError(
+                    "OpenAI keyword batch response missed an item.",
+                    details={"label": request.label},
+                )
+            results.append(answer)
+        return results
+
+    async def _generate_keyword_completion(
+        self,
+        prompt: str,
+        *,
+        max_output_tokens: int = KEYWORD_MAX_OUTPUT_TOKENS,
+        json_output: bool = False,
+    ) -> str:
         """Internal helper for keyword generation requests."""
+        options: Dict[str, Any] = {}
+        if json_output:
+            options["text"] = {"format": {"type": "json_object"}}
+
+        await self._limiter.acquire()
         try:
-            completion = await self._client.responses.create(
-                model=self._config.keyword_model,
-                input=prompt,
-                temperature=0.2,
-                max_output_tokens=120,
+            completion = await asyncio.wait_for(
+                self._client.responses.create(
+                    model=self._config.keyword_model,
+                    input=prompt,
+                    temperature=KEYWORD_TEMPERATURE,
+                    max_output_tokens=max_output_tokens,
+                    **options,
+                ),
+                timeout=REQUEST_DEADLINE_SECONDS,
             )
+        except asyncio.TimeoutError as exc:
+            raise ExternalServiceError("Timed out generating keywords.") from exc
         except Exception as exc:
             raise ExternalServiceError("Failed to generate keywords.") from exc
 
@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import time
+
+
+class RateLimiter:
+    """Token-bucket limiter usable from both coroutines and worker threads.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Each acquire reserves its tokens immediately (the balance may go
+    negative) and then waits until the reservation is covered, so callers
+    are served in arrival order without holding the lock while sleeping.
+    """
+
+    def __init__(self, *, rate: float, capacity: float) -> None:
+        if rate <= 0:
+            raise ValueError("rate must be positive.")
+        if capacity <= 0:
+            raise ValueError("capacity must be positive.")
+
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float) -> float:
+        """Take tokens from the bucket and return how long to wait for them."""
+        with self._lock:
+            now = time.monotonic()
+            elapsed = now - self._updated_at
+            self._tokens = min(self._capacity, self._tokens + elapsed * self._rate)
+            self._updated_at = now
+            self._tokens -= tokens
+            if self._tokens >= 0:
+                return 0.0
+            return -self._tokens / self._rate
+
+    async def acquire(self, tokens: float = 1) -> None:
+        """Wait on the event loop until the tokens are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def acquire_blocking(self, tokens: float = 1) -> None:
+        """Block the calling thread until the tokens are available."""
+        delay = self._reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
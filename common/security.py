@@ -1,17 +1,21 @@
 from __future__ import annotations
 
-from types import SimpleNamespace
+from typing import Optional
 
-from passlib.context import CryptContext
 import bcrypt
 
-if not hasattr(bcrypt, "__about__"):
-    bcrypt.__about__ = SimpleNamespace(__version__=bcrypt.__version__)
-
+from common.config import get_settings
 from common.errors import ValidationError
 
+# resolved on first use so importing this module does not require settings
+_bcrypt_rounds: Optional[int] = None
+
 
-_pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+def _get_bcrypt_rounds() -> int:
+    global _bcrypt_rounds
+    if _bcrypt_rounds is None:
+        _bcrypt_rounds = get_settings().passwords.bcrypt_rounds
+    return _bcrypt_rounds
 
 
 def hash_password(plain_password: str) -> str:
@@ -19,9 +23,15 @@ def hash_password(plain_password: str) -> str:
     normalized = plain_password.strip()
     if len(normalized) < 8:
         raise ValidationError("Password must be at least 8 characters long.")
-    return _pwd_context.hash(normalized)
+    salt = bcrypt.gensalt(rounds=_get_bcrypt_rounds())
+    return bcrypt.hashpw(normalized.encode("utf-8"), salt).decode("ascii")
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a raw password against its bcrypt hash."""
-    return _pwd_context.verify(plain_password, hashed_password)
+    try:
+        return bcrypt.checkpw(plain_password.encode("utf-8"), hashed_password.encode("utf-8"))
+    except ValueError:
+        # malformed or non-bcrypt hash stored in the sheet
+        return False
+
@@ -1,6 +1,10 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
+from functools import lru_cache
+from typing import Tuple
+
+_UTC_SECONDS_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
 
 
 def utc_now() -> datetime:
@@ -8,8 +12,18 @@ def utc_now() -> datetime:
     return datetime.now(timezone.utc)
 
 
+def utc_now_with_iso() -> Tuple[datetime, str]:
+    """Return the current UTC datetime together with its stored string form."""
+    now = datetime.now(timezone.utc)
+    return now, now.strftime(_UTC_SECONDS_FORMAT)
+
+
 def to_isoformat(dt: datetime, *, keep_microseconds: bool = False) -> str:
     """Serialize a datetime to ISO-8601 string in UTC."""
+    # fast path: values from utc_now()/from_isoformat() are already UTC
+    if dt.tzinfo is timezone.utc and not keep_microseconds:
+        return dt.strftime(_UTC_SECONDS_FORMAT)
+
     if dt.tzinfo is None:
         dt = dt.replace(tzinfo=timezone.utc)
     else:
@@ -22,14 +36,35 @@ def to_isoformat(dt: datetime, *, keep_microseconds: bool = False) -> str:
     return iso.replace("+00:00", "Z")
 
 
+# (value, parsed) of the most recent call; rows listed together usually share
+# timestamps, so an equality check here skips the lru_cache lookup entirely
+_last_parsed: Tuple[str, datetime] = ("1970-01-01T00:00:00Z", datetime(1970, 1, 1, tzinfo=timezone.utc))
+
+
 def from_isoformat(value: str) -> datetime:
-    """Parse an ISO-8601 string into a datetime."""
+    """Parse an ISO-8601 string into a datetime.
+
+    Results are memoized because the same stored timestamps are parsed on
+    every request that reads a user, child, or session row.
+    """
+    global _last_parsed
+    last = _last_parsed
+    if value == last[0]:
+        return last[1]
+    dt = _parse_isoformat(value)
+    # a single tuple swap, so concurrent callers never see a mismatched pair
+    _last_parsed = (value, dt)
+    return dt
+
+
+@lru_cache(maxsize=2048)
+def _parse_isoformat(value: str) -> datetime:
     if value.endswith("Z"):
         value = value[:-1] + "+00:00"
 
     dt = datetime.fromisoformat(value)
     if dt.tzinfo is None:
-        dt = dt.replace(tzinfo=timezone.utc)
-    else:
+        return dt.replace(tzinfo=timezone.utc)
+    if dt.tzinfo is not timezone.utc:
         dt = dt.astimezone(timezone.utc)
     return dt
@@ -1,14 +1,31 @@
 from __future__ import annotations
 
+from contextlib import asynccontextmanager
+from typing import AsyncIterator
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 
+from api.dependencies import build_services
 from api.routers.auth import router as auth_router
 from api.routers.children import router as children_router
 from api.routers.sessions import router as sessions_router
 from common.config import get_settings
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # build Sheets/OpenAI clients and services once per process
+    services = build_services()
+    services.start()
+    app.state.services = services
+    try:
+        yield
+    finally:
+        await services.aclose()
+
+
 def create_app() -> FastAPI:
     settings = get_settings()
 
@@ -17,14 +34,17 @@ def create_app() -> FastAPI:
         version="0.1.0",
         docs_url="/docs",
         redoc_url="/redoc",
+        lifespan=lifespan,
+        # orjson encodes UUIDs and datetimes natively and much faster than stdlib json
+        default_response_class=ORJSONResponse,
     )
 
     app.add_middleware(
         CORSMiddleware,
-        allow_origins=["*"],
+        allow_origins=settings.cors.allow_origins,
         allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
+        allow_methods=("GET", "POST", "OPTIONS"),
+        allow_headers=("authorization", "content-type"),
     )
 
     app.include_router(auth_router)
@@ -1,29 +1,69 @@
 from __future__ import annotations
 
+import asyncio
+import math
+import re
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple, TypeVar
 
+from common.cache import TTLCache
 from common.errors import NotFoundError
+from common.rate_limit import RateLimiter
 
 try:
     import gspread
     from gspread import Spreadsheet, Worksheet
-    from gspread.exceptions import APIError, WorksheetNotFound
+    from gspread.exceptions import APIError
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
 except ImportError as exc:
     gspread = None
     Spreadsheet = Worksheet = Any
-    WorksheetNotFound = APIError = Exception
+    APIError = Exception
     _IMPORT_ERROR = exc
 else:
     _IMPORT_ERROR = None
 
 
+T = TypeVar("T")
+
+
 class SheetsRepositoryError(RuntimeError):
     """Raised when interacting with Google Sheets fails."""
 
 
+USER_CACHE_MAXSIZE = 4096
+USER_CACHE_TTL_SECONDS = 60.0
+CHILD_CACHE_MAXSIZE = 1024
+CHILD_CACHE_TTL_SECONDS = 60.0
+OWNERSHIP_CACHE_MAXSIZE = 4096
+OWNERSHIP_CACHE_TTL_SECONDS = 60.0
+LATEST_SESSION_CACHE_MAXSIZE = 1024
+LATEST_SESSION_CACHE_TTL_SECONDS = 60.0
+ROW_INDEX_TTL_SECONDS = 30.0
+
+ID_COLUMN = 1
+USER_EMAIL_COLUMN = 2
+
+# "users!A5:H5" -> 5, as returned in an append response's updatedRange
+_UPDATED_ROW_RE = re.compile(r"![A-Z]+(\d+)")
+# plain numbers that USER_ENTERED input turns into numeric cells: "7", "-3", "2.5"
+_NUMBER_CELL_RE = re.compile(r"[+-]?(?:\d+\.?\d*|\.\d+)(?:[eE][+-]?\d+)?")
+
+# defaults for pacing Sheets calls under the per-user quota (about 5 rps);
+# deployments override them through GoogleSheetsSettings
+SHEETS_REQUESTS_PER_SECOND = 5.0
+SHEETS_BURST = 20
+SHEETS_POOL_SIZE = 20
+# blocking gspread calls in flight at once, on a pool separate from the default executor
+SHEETS_MAX_CONCURRENCY = 6
+
+
 CHILDREN_HEADERS: List[str] = [
     "child_id",
     "nickname",
@@ -68,6 +108,81 @@ USER_CHILDREN_HEADERS: List[str] = [
 ]
 
 
+# immutable row objects read back from the sheets; field order follows the headers
+ChildRow = namedtuple("ChildRow", CHILDREN_HEADERS)
+SessionRow = namedtuple("SessionRow", SESSIONS_HEADERS)
+UserRow = namedtuple("UserRow", USERS_HEADERS)
+
+CellConverter = Callable[[Any], str]
+
+
+def _text_cell(value: Any) -> str:
+    return "" if value is None else str(value)
+
+
+def _age_cell(value: Any) -> str:
+    return "" if value is None or value == "" else str(int(value))
+
+
+def _timestamp_cell(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return _text_cell(value)
+
+
+# only these columns need more than str(); everything else is plain text
+_CELL_CONVERTERS: Dict[str, CellConverter] = {
+    "age": _age_cell,
+    "created_at": _timestamp_cell,
+    "updated_at": _timestamp_cell,
+    "last_login_at": _timestamp_cell,
+}
+
+
+def _user_entered_cell(cell: str) -> Dict[str, Any]:
+    """appendCells cell typed the way a USER_ENTERED values write parses ``cell``.
+
+    Numbers, booleans and formulas get their own value types and empty
+    strings stay blank; everything else, ISO timestamps included, is text.
+    """
+    if not cell:
+        return {}
+    if cell.startswith("="):
+        value: Dict[str, Any] = {"formulaValue": cell}
+    elif _NUMBER_CELL_RE.fullmatch(cell) and math.isfinite(number := float(cell)):
+        value = {"numberValue": int(number) if number.is_integer() else number}
+    elif cell.upper() in ("TRUE", "FALSE"):
+        value = {"boolValue": cell.upper() == "TRUE"}
+    else:
+        value = {"stringValue": cell}
+    return {"userEnteredValue": value}
+
+
+def _row_columns(headers: Sequence[str]) -> Tuple[Tuple[str, CellConverter], ...]:
+    """Pair each header with its cell converter, in sheet order."""
+    return tuple((header, _CELL_CONVERTERS.get(header, _text_cell)) for header in headers)
+
+
+CHILDREN_COLUMNS = _row_columns(CHILDREN_HEADERS)
+SESSIONS_COLUMNS = _row_columns(SESSIONS_HEADERS)
+USERS_COLUMNS = _row_columns(USERS_HEADERS)
+USER_CHILDREN_COLUMNS = _row_columns(USER_CHILDREN_HEADERS)
+
+
+def _column_letter(index: int) -> str:
+    """Return the Excel-style column letter for a 1-based index."""
+    result = ""
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        result = chr(65 + remainder) + result
+    return result
+
+
+# full-row A1 ranges, e.g. "A{row}:M{row}", resolved once from the headers
+CHILDREN_ROW_RANGE = f"A{{row}}:{_column_letter(len(CHILDREN_HEADERS))}{{row}}"
+USERS_ROW_RANGE = f"A{{row}}:{_column_letter(len(USERS_HEADERS))}{{row}}"
+
+
 @dataclass(frozen=True)
 class SheetNames:
     children: str = "children"
@@ -84,7 +199,27 @@ def create_client(credentials_path: Path) -> "gspread.Client":
             "Install it via `pip install gspread`."
         ) from _IMPORT_ERROR
 
-    return gspread.service_account(filename=str(credentials_path))
+    client = gspread.service_account(filename=str(credentials_path))
+    # keep TLS connections to the Sheets API alive across calls. Only failed
+    # connection attempts are retried: those never reached the API, so they
+    # cost no quota and cannot replay a write. HTTP error statuses still come
+    # back to gspread and surface as APIError.
+    adapter = HTTPAdapter(
+        pool_connections=SHEETS_POOL_SIZE,
+        pool_maxsize=SHEETS_POOL_SIZE,
+        max_retries=Retry(
+            total=3,
+            connect=3,
+            read=0,
+            status=0,
+            other=0,
+            backoff_factor=0.2,
+            respect_retry_after_header=False,
+            raise_on_status=False,
+        ),
+    )
+    client.http_client.session.mount("https://", adapter)
+    return client
 
 
 class SheetsRepository:
@@ -96,11 +231,44 @@ class SheetsRepository:
         spreadsheet_id: str,
         *,
         sheet_names: Optional[SheetNames] = None,
+        requests_per_second: float = SHEETS_REQUESTS_PER_SECOND,
+        burst: int = SHEETS_BURST,
     ) -> None:
         if not spreadsheet_id:
             raise ValueError("spreadsheet_id must be provided.")
 
         self._client = client
+        self._executor = ThreadPoolExecutor(
+            max_workers=SHEETS_MAX_CONCURRENCY, thread_name_prefix="sheets"
+        )
+        self._semaphore = asyncio.Semaphore(SHEETS_MAX_CONCURRENCY)
+        self._limiter = RateLimiter(rate=requests_per_second, capacity=burst)
+        # user_id -> users row; every authenticated request reads it
+        self._user_cache: TTLCache[str, UserRow] = TTLCache(
+            maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        # email -> user_id; resolved through _user_cache so one eviction covers both
+        self._email_cache: TTLCache[str, str] = TTLCache(
+            maxsize=USER_CACHE_MAXSIZE, ttl=USER_CACHE_TTL_SECONDS
+        )
+        # child_id -> children row, refreshed by update_child
+        self._child_cache: TTLCache[str, ChildRow] = TTLCache(
+            maxsize=CHILD_CACHE_MAXSIZE, ttl=CHILD_CACHE_TTL_SECONDS
+        )
+        # (user_id, child_id) pairs known to be linked; links are never removed,
+        # so only positive answers are cached
+        self._ownership_cache: TTLCache[Tuple[str, str], bool] = TTLCache(
+            maxsize=OWNERSHIP_CACHE_MAXSIZE, ttl=OWNERSHIP_CACHE_TTL_SECONDS
+        )
+        # child_id -> newest sessions row, written through by create_sessions_bulk
+        self._latest_sessions: TTLCache[str, SessionRow] = TTLCache(
+            maxsize=LATEST_SESSION_CACHE_MAXSIZE, ttl=LATEST_SESSION_CACHE_TTL_SECONDS
+        )
+        self._latest_sessions_lock = threading.Lock()
+        # (worksheet title, column) -> {cell value: row number}
+        self._row_indexes: TTLCache[Tuple[str, int], Dict[str, int]] = TTLCache(
+            maxsize=8, ttl=ROW_INDEX_TTL_SECONDS
+        )
         try:
             self._spreadsheet: Spreadsheet = client.open_by_key(spreadsheet_id)
         except APIError as exc:
@@ -109,33 +277,35 @@ class SheetsRepository:
             ) from exc
 
         names = sheet_names or SheetNames()
+        # one metadata request for every tab instead of a worksheet() call each
         try:
-            self._children_ws: Worksheet = self._spreadsheet.worksheet(names.children)
-        except WorksheetNotFound as exc:
+            worksheets = {ws.title: ws for ws in self._spreadsheet.worksheets()}
+        except APIError as exc:
             raise SheetsRepositoryError(
-                f"Worksheet '{names.children}' not found in spreadsheet."
+                f"Failed to list worksheets in spreadsheet '{spreadsheet_id}'."
             ) from exc
 
-        try:
-            self._sessions_ws: Worksheet = self._spreadsheet.worksheet(names.sessions)
-        except WorksheetNotFound as exc:
-            raise SheetsRepositoryError(
-                f"Worksheet '{names.sessions}' not found in spreadsheet."
-            ) from exc
+        self._children_ws: Worksheet = self._require_worksheet(worksheets, names.children)
+        self._sessions_ws: Worksheet = self._require_worksheet(worksheets, names.sessions)
+        self._users_ws: Worksheet = self._require_worksheet(worksheets, names.users)
+        self._user_children_ws: Worksheet = self._require_worksheet(
+            worksheets, names.user_children
+        )
 
-        try:
-            self._users_ws: Worksheet = self._spreadsheet.worksheet(names.users)
-        except WorksheetNotFound as exc:
-            raise SheetsRepositoryError(
-                f"Worksheet '{names.users}' not found in spreadsheet."
-            ) from exc
+    async def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Run a blocking repository call on the dedicated Sheets thread pool.
 
-        try:
-            self._user_children_ws: Worksheet = self._spreadsheet.worksheet(names.user_children)
-        except WorksheetNotFound as exc:
-            raise SheetsRepositoryError(
-                f"Worksheet '{names.user_children}' not found in spreadsheet."
-            ) from exc
+        Rate limiting and callers beyond SHEETS_MAX_CONCURRENCY both wait on
+        the event loop, where they can still be cancelled, so pool threads
+        only ever run Sheets calls and never sleep.
+        """
+        await self._limiter.acquire()
+        async with self._semaphore:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, fn, *args)
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
 
     # --------------------------------------------------------------------- #
     # Children operations                                                   #
@@ -143,34 +313,127 @@ class SheetsRepository:
 
     def create_child(self, record: Dict[str, Any]) -> None:
         """Append a child record to the sheet."""
-        row = self._serialize_row(CHILDREN_HEADERS, record)
-        self._children_ws.append_row(row, value_input_option="USER_ENTERED")
+        self.create_children_bulk([record])
+
+    def create_children_bulk(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Append several child records with a single append request."""
+        self._append_records(self._children_ws, CHILDREN_COLUMNS, records)
+
+    def create_child_and_link(
+        self, child_record: Dict[str, Any], link_record: Dict[str, Any]
+    ) -> None:
+        """Append a child row and its user_children link in one request."""
+        self.create_children_and_links_bulk([(child_record, link_record)])
+
+    def create_children_and_links_bulk(
+        self, pairs: Sequence[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> None:
+        """Append child rows and their links with one spreadsheets.batchUpdate.
+
+        Both appendCells requests are applied atomically, so a child row is
+        never written without the link that makes it reachable.
+        """
+        if not pairs:
+            return
+        child_rows = [self._serialize_row(CHILDREN_COLUMNS, child) for child, _ in pairs]
+        link_rows = [self._serialize_row(USER_CHILDREN_COLUMNS, link) for _, link in pairs]
+        self._spreadsheet.batch_update(
+            {
+                "requests": [
+                    self._append_cells_request(self._children_ws, child_rows),
+                    self._append_cells_request(self._user_children_ws, link_rows),
+                ]
+            }
+        )
+        # appendCells does not report the row numbers, so the index is dropped
+        self._index_appended_rows(self._children_ws, None, child_rows)
+        for _, link in pairs:
+            self._remember_ownership(str(link["user_id"]), str(link["child_id"]))
 
-    def get_child(self, child_id: str) -> Dict[str, Any]:
+    def get_child(self, child_id: str) -> ChildRow:
         """Fetch a single child record by identifier."""
-        row_index = self._find_row_by_id(self._children_ws, child_id)
-        if row_index is None:
+        row = self._find_child(child_id)
+        if row is None:
             raise NotFoundError(f"Child '{child_id}' not found.", details={"child_id": child_id})
+        return row
+
+    def fetch_child_with_ownership(
+        self, user_id: str, child_id: str
+    ) -> Tuple[bool, Optional[ChildRow]]:
+        """Check ownership and fetch the child row, usually in one Sheets request.
+
+        Only the child's own row is read, at the number cached in the row
+        index; without one, ownership is checked first and the child is
+        looked up as usual. Returns (False, None) when the user is not
+        linked to the child.
+        """
+        if self._ownership_cache.get((user_id, child_id)):
+            return True, self._find_child(child_id)
+
+        mappings_range = self._sheet_range(self._user_children_ws)
+        index = self._row_indexes.get((self._children_ws.title, ID_COLUMN))
+        row_index = index.get(child_id) if index is not None else None
+        if row_index is None or self._child_cache.get(child_id) is not None:
+            values = self.batch_get([mappings_range])
+            if not self._mappings_link(values[mappings_range], user_id, child_id):
+                return False, None
+            self._remember_ownership(user_id, child_id)
+            return True, self._find_child(child_id)
+
+        child_range = f"{self._sheet_range(self._children_ws)}!" + CHILDREN_ROW_RANGE.format(
+            row=row_index
+        )
+        values = self.batch_get([mappings_range, child_range])
+        if not self._mappings_link(values[mappings_range], user_id, child_id):
+            return False, None
+        self._remember_ownership(user_id, child_id)
+
+        row_values = values[child_range][0] if values[child_range] else []
+        if row_values and row_values[0] == child_id:
+            return True, self._cache_child(row_values)
+        # the row moved since the index was built; drop it so _find_child rescans
+        self._row_indexes.pop((self._children_ws.title, ID_COLUMN))
+        return True, self._find_child(child_id)
+
+    @staticmethod
+    def _mappings_link(mappings: List[List[str]], user_id: str, child_id: str) -> bool:
+        return any(row[:2] == [user_id, child_id] for row in mappings[1:])
+
+    def _find_child(self, child_id: str) -> Optional[ChildRow]:
+        cached = self._child_cache.get(child_id)
+        if cached is not None:
+            return cached
 
-        values = self._children_ws.row_values(row_index)
-        record = self._deserialize_row(CHILDREN_HEADERS, values)
-        record["age"] = int(record["age"]) if record.get("age") else None
-        return record
+        found = self._read_row(self._children_ws, column_index=ID_COLUMN, value=child_id)
+        if found is None:
+            return None
+        _, values = found
+        return self._cache_child(values)
+
+    def _cache_child(self, values: List[str]) -> ChildRow:
+        row = self._child_row(self._deserialize_row(ChildRow, values))
+        self._child_cache.set(row.child_id, row)
+        return row
 
-    def update_child(self, child_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
+    @staticmethod
+    def _child_row(row: ChildRow) -> ChildRow:
+        # the sheet hands back age as text; callers always get an int
+        return row._replace(age=int(row.age) if row.age not in ("", None) else None)
+
+    def update_child(self, child_id: str, updates: Dict[str, Any]) -> ChildRow:
         """Update an existing child record."""
-        row_index = self._find_row_by_id(self._children_ws, child_id)
-        if row_index is None:
+        found = self._read_row(self._children_ws, column_index=ID_COLUMN, value=child_id)
+        if found is None:
             raise NotFoundError(f"Child '{child_id}' not found.", details={"child_id": child_id})
 
-        current_values = self._children_ws.row_values(row_index)
-        current_record = self._deserialize_row(CHILDREN_HEADERS, current_values)
-        current_record.update(updates)
-        new_row = self._serialize_row(CHILDREN_HEADERS, current_record)
+        row_index, current_values = found
+        current = self._child_row(self._deserialize_row(ChildRow, current_values)._replace(**updates))
+        new_row = self._serialize_row(CHILDREN_COLUMNS, current._asdict())
 
-        cell_range = f"A{row_index}:{self._column_letter(len(CHILDREN_HEADERS))}{row_index}"
-        self._children_ws.update(cell_range, [new_row])
-        return current_record
+        cell_range = CHILDREN_ROW_RANGE.format(row=row_index)
+        self.batch_update(self._children_ws, [(cell_range, new_row)])
+        self._child_cache.pop(child_id)
+        return current
 
     # --------------------------------------------------------------------- #
     # Session operations                                                    #
@@ -178,146 +441,300 @@ class SheetsRepository:
 
     def create_session(self, record: Dict[str, Any]) -> None:
         """Append a session record to the sheet."""
-        row = self._serialize_row(SESSIONS_HEADERS, record)
-        self._sessions_ws.append_row(row, value_input_option="USER_ENTERED")
+        self.create_sessions_bulk([record])
+
+    def create_sessions_bulk(self, records: Sequence[Dict[str, Any]]) -> None:
+        """Append several session records with a single append request."""
+        rows = self._append_records(self._sessions_ws, SESSIONS_COLUMNS, records)
+        for values in rows:
+            self._remember_latest_session(self._deserialize_row(SessionRow, values))
 
-    def get_session(self, session_id: str) -> Dict[str, Any]:
+    def get_session(self, session_id: str) -> SessionRow:
         """Fetch a single session record by identifier."""
-        row_index = self._find_row_by_id(self._sessions_ws, session_id)
-        if row_index is None:
+        found = self._read_row(self._sessions_ws, column_index=ID_COLUMN, value=session_id)
+        if found is None:
             raise NotFoundError(
                 f"Session '{session_id}' not found.", details={"session_id": session_id}
             )
-        values = self._sessions_ws.row_values(row_index)
-        return self._deserialize_row(SESSIONS_HEADERS, values)
+        _, values = found
+        return self._deserialize_row(SessionRow, values)
 
     # --------------------------------------------------------------------- #
     # User operations                                                      #
     # --------------------------------------------------------------------- #
 
     def create_user(self, record: Dict[str, Any]) -> None:
-        row = self._serialize_row(USERS_HEADERS, record)
-        self._users_ws.append_row(row, value_input_option="USER_ENTERED")
-
-    def get_user_by_email(self, email: str) -> Optional[Dict[str, Any]]:
-        row_index = self._find_row_by_column(self._users_ws, column_index=2, value=email)
-        if row_index is None:
+        row = self._serialize_row(USERS_COLUMNS, record)
+        response = self._users_ws.append_row(row, value_input_option="USER_ENTERED")
+        self._index_appended_rows(self._users_ws, response, [row])
+        self.invalidate_user(str(record["user_id"]))
+
+    def get_user_by_email(self, email: str) -> Optional[UserRow]:
+        user_id = self._email_cache.get(email)
+        if user_id is not None:
+            cached = self._user_cache.get(user_id)
+            if cached is not None and cached.email == email:
+                return cached
+
+        found = self._read_row(self._users_ws, column_index=USER_EMAIL_COLUMN, value=email)
+        if found is None:
             return None
-        values = self._users_ws.row_values(row_index)
-        return self._deserialize_row(USERS_HEADERS, values)
+        _, values = found
+        row = self._deserialize_row(UserRow, values)
+        self._cache_user(row)
+        return row
 
-    def get_user_by_id(self, user_id: str) -> Optional[Dict[str, Any]]:
-        row_index = self._find_row_by_id(self._users_ws, user_id)
-        if row_index is None:
+    def get_user_by_id(self, user_id: str) -> Optional[UserRow]:
+        cached = self._user_cache.get(user_id)
+        if cached is not None:
+            return cached
+
+        found = self._read_row(self._users_ws, column_index=ID_COLUMN, value=user_id)
+        if found is None:
             return None
-        values = self._users_ws.row_values(row_index)
-        return self._deserialize_row(USERS_HEADERS, values)
+        _, values = found
+        row = self._deserialize_row(UserRow, values)
+        self._cache_user(row)
+        return row
+
+    def invalidate_user(self, user_id: str) -> None:
+        """Drop a cached user row so the next read goes back to the sheet."""
+        self._user_cache.pop(user_id)
+
+    def _cache_user(self, row: UserRow) -> None:
+        self._user_cache.set(row.user_id, row)
+        self._email_cache.set(row.email, row.user_id)
 
     def link_user_child(self, record: Dict[str, Any]) -> None:
-        row = self._serialize_row(USER_CHILDREN_HEADERS, record)
+        row = self._serialize_row(USER_CHILDREN_COLUMNS, record)
         self._user_children_ws.append_row(row, value_input_option="USER_ENTERED")
+        self._remember_ownership(str(record["user_id"]), str(record["child_id"]))
+
+    def list_children_for_user(self, user_id: str) -> List[ChildRow]:
+        # one batchGet for both sheets instead of a lookup per linked child
+        mappings_range = self._sheet_range(self._user_children_ws)
+        children_range = self._sheet_range(self._children_ws)
+        values = self.batch_get([mappings_range, children_range])
 
-    def list_children_for_user(self, user_id: str) -> List[Dict[str, Any]]:
-        mappings = self._user_children_ws.get_all_records()
         child_ids = [
-            entry["child_id"]
-            for entry in mappings
-            if entry.get("user_id") == user_id
+            row[1]
+            for row in values[mappings_range][1:]
+            if len(row) > 1 and row[0] == user_id
+        ]
+        children_by_id: Dict[str, List[str]] = {}
+        for row in values[children_range][1:]:
+            if row:
+                children_by_id.setdefault(row[0], row)
+
+        return [
+            self._child_row(self._deserialize_row(ChildRow, children_by_id[child_id]))
+            for child_id in child_ids
+            if child_id in children_by_id
         ]
-        results: List[Dict[str, Any]] = []
-        for child_id in child_ids:
-            row_index = self._find_row_by_id(self._children_ws, child_id)
-            if row_index is None:
-                continue
-            values = self._children_ws.row_values(row_index)
-            results.append(self._deserialize_row(CHILDREN_HEADERS, values))
-        return results
 
     def user_owns_child(self, user_id: str, child_id: str) -> bool:
-        mappings = self._user_children_ws.get_all_records()
-        return any(
-            entry.get("user_id") == user_id and entry.get("child_id") == child_id
-            for entry in mappings
-        )
+        if self._ownership_cache.get((user_id, child_id)):
+            return True
 
-    def update_user(self, user_id: str, updates: Dict[str, Any]) -> Dict[str, Any]:
-        row_index = self._find_row_by_id(self._users_ws, user_id)
-        if row_index is None:
+        mappings = self._user_children_ws.get_all_values()
+        owns = self._mappings_link(mappings, user_id, child_id)
+        if owns:
+            self._remember_ownership(user_id, child_id)
+        return owns
+
+    def _remember_ownership(self, user_id: str, child_id: str) -> None:
+        self._ownership_cache.set((user_id, child_id), True)
+
+    def update_user(self, user_id: str, updates: Dict[str, Any]) -> UserRow:
+        found = self._read_row(self._users_ws, column_index=ID_COLUMN, value=user_id)
+        if found is None:
             raise NotFoundError(f"User '{user_id}' not found.", details={"user_id": user_id})
 
-        current_values = self._users_ws.row_values(row_index)
-        current_record = self._deserialize_row(USERS_HEADERS, current_values)
-        current_record.update(updates)
-        new_row = self._serialize_row(USERS_HEADERS, current_record)
+        row_index, current_values = found
+        current = self._deserialize_row(UserRow, current_values)._replace(**updates)
+        new_row = self._serialize_row(USERS_COLUMNS, current._asdict())
+
+        cell_range = USERS_ROW_RANGE.format(row=row_index)
+        self.batch_update(self._users_ws, [(cell_range, new_row)])
+        if "email" in updates:
+            self._row_indexes.pop((self._users_ws.title, USER_EMAIL_COLUMN))
+        self.invalidate_user(user_id)
+        return current
+
+    def get_latest_session_for_child(self, child_id: str) -> Optional[SessionRow]:
+        cached = self._latest_sessions.get(child_id)
+        if cached is not None:
+            return cached
+
+        # scan raw values by column position; only the winning row is materialized
+        child_col = SESSIONS_HEADERS.index("child_id")
+        created_col = SESSIONS_HEADERS.index("created_at")
+        best_row: Optional[List[str]] = None
+        best_created = ""
+        for row in self._sessions_ws.get_all_values()[1:]:
+            if len(row) <= created_col or row[child_col] != child_id:
+                continue
+            if row[created_col] > best_created:
+                best_created = row[created_col]
+                best_row = row
 
-        cell_range = f"A{row_index}:{self._column_letter(len(USERS_HEADERS))}{row_index}"
-        self._users_ws.update(cell_range, [new_row])
-        return current_record
+        if best_row is None:
+            return None
+        return self._remember_latest_session(self._deserialize_row(SessionRow, best_row))
 
-    def get_latest_session_for_child(self, child_id: str) -> Optional[Dict[str, Any]]:
-        all_rows = self._sessions_ws.get_all_records()
-        latest_row: Optional[Dict[str, Any]] = None
-        latest_created: Optional[str] = None
+    def _remember_latest_session(self, row: SessionRow) -> SessionRow:
+        # a slow scan must not replace a newer row written in the meantime
+        with self._latest_sessions_lock:
+            current = self._latest_sessions.get(row.child_id)
+            if current is not None and current.created_at > row.created_at:
+                return current
+            self._latest_sessions.set(row.child_id, row)
+            return row
 
-        for row in all_rows:
-            if row.get("child_id") != child_id:
-                continue
-            created_at = row.get("created_at")
-            if not created_at:
-                continue
-            if latest_created is None or created_at > latest_created:
-                latest_created = created_at
-                latest_row = row
+    # --------------------------------------------------------------------- #
+    # Batch operations                                                      #
+    # --------------------------------------------------------------------- #
+
+    def batch_get(self, ranges: List[str]) -> Dict[str, List[List[str]]]:
+        """Read several A1 ranges in a single values.batchGet request.
 
-        return latest_row
+        The result is keyed by the requested range strings, in request order.
+        """
+        response = self._spreadsheet.values_batch_get(ranges)
+        value_ranges = response.get("valueRanges", [])
+        return {
+            range_name: value_range.get("values", [])
+            for range_name, value_range in zip(ranges, value_ranges)
+        }
+
+    def batch_update(
+        self, worksheet: Worksheet, updates: List[Tuple[str, List[Any]]]
+    ) -> None:
+        """Write several (A1 range, row) pairs in a single values.batchUpdate.
+
+        Values are USER_ENTERED, matching how rows are appended.
+        """
+        title = self._sheet_range(worksheet)
+        self._spreadsheet.values_batch_update(
+            {
+                "valueInputOption": "USER_ENTERED",
+                "data": [
+                    {"range": f"{title}!{cell_range}", "values": [row]}
+                    for cell_range, row in updates
+                ],
+            }
+        )
 
     # --------------------------------------------------------------------- #
     # Helpers                                                               #
     # --------------------------------------------------------------------- #
 
     @staticmethod
-    def _serialize_row(headers: Iterable[str], record: Dict[str, Any]) -> List[Any]:
-        """Convert a record dict into an ordered row matching the headers."""
-        row: List[Any] = []
-        for header in headers:
-            value = record.get(header, "")
-            if isinstance(value, datetime):
-                row.append(value.isoformat())
-            else:
-                row.append("" if value is None else str(value))
-        return row
+    def _serialize_row(
+        columns: Sequence[Tuple[str, CellConverter]], record: Dict[str, Any]
+    ) -> List[Any]:
+        """Convert a record dict into an ordered row using a precomputed column table."""
+        return [convert(record.get(header, "")) for header, convert in columns]
 
     @staticmethod
-    def _deserialize_row(headers: List[str], row_values: List[str]) -> Dict[str, Any]:
-        """Convert a row list into a dict keyed by headers."""
-        values = row_values + [""] * (len(headers) - len(row_values))
-        return {header: values[idx] for idx, header in enumerate(headers)}
+    def _deserialize_row(row_type: Any, row_values: List[str]) -> Any:
+        """Convert a row list into a row namedtuple, padding trimmed trailing cells."""
+        width = len(row_type._fields)
+        if len(row_values) < width:
+            row_values = row_values + [""] * (width - len(row_values))
+        return row_type._make(row_values[:width])
 
     @staticmethod
-    def _find_row_by_id(worksheet: Worksheet, identifier: str) -> Optional[int]:
-        """Locate the row index for a given record ID."""
-        column_values = worksheet.col_values(1)
-        for idx, value in enumerate(column_values, start=1):
-            if value == identifier:
-                return idx
-        return None
+    def _require_worksheet(worksheets: Dict[str, Worksheet], title: str) -> Worksheet:
+        try:
+            return worksheets[title]
+        except KeyError as exc:
+            raise SheetsRepositoryError(
+                f"Worksheet '{title}' not found in spreadsheet."
+            ) from exc
 
     @staticmethod
-    def _find_row_by_column(
-        worksheet: Worksheet, *, column_index: int, value: str
-    ) -> Optional[int]:
-        """Locate the row index where a column matches the provided value."""
+    def _sheet_range(worksheet: Worksheet) -> str:
+        """Return an A1 range covering the whole worksheet."""
+        title = worksheet.title.replace("'", "''")
+        return f"'{title}'"
+
+    def _read_row(
+        self, worksheet: Worksheet, *, column_index: int, value: str
+    ) -> Optional[Tuple[int, List[str]]]:
+        """Return the row number and values of the first row matching value.
+
+        Row numbers come from a short-lived per-column index. A cached hit
+        is verified against the fetched row; a miss or mismatch rebuilds the
+        index once, so rows written by other workers are still found.
+        """
+        index = self._row_indexes.get((worksheet.title, column_index))
+        if index is not None:
+            row_index = index.get(value)
+            if row_index is not None:
+                values = worksheet.row_values(row_index)
+                if len(values) >= column_index and values[column_index - 1] == value:
+                    return row_index, values
+
+        row_index = self._build_row_index(worksheet, column_index).get(value)
+        if row_index is None:
+            return None
+        return row_index, worksheet.row_values(row_index)
+
+    def _build_row_index(self, worksheet: Worksheet, column_index: int) -> Dict[str, int]:
+        """Scan a column once and cache a value -> row number mapping."""
         column_values = worksheet.col_values(column_index)
-        for idx, cell_value in enumerate(column_values, start=1):
-            if cell_value == value:
-                return idx
-        return None
+        # built in C by dict(zip()); walking bottom-up lets the first occurrence win
+        index: Dict[str, int] = dict(
+            zip(reversed(column_values), range(len(column_values), 0, -1))
+        )
+        self._row_indexes.set((worksheet.title, column_index), index)
+        return index
+
+    def _append_records(
+        self,
+        worksheet: Worksheet,
+        columns: Sequence[Tuple[str, CellConverter]],
+        records: Sequence[Dict[str, Any]],
+    ) -> List[List[str]]:
+        if not records:
+            return []
+        rows = [self._serialize_row(columns, record) for record in records]
+        response = worksheet.append_rows(rows, value_input_option="USER_ENTERED")
+        self._index_appended_rows(worksheet, response, rows)
+        return rows
 
     @staticmethod
-    def _column_letter(index: int) -> str:
-        """Return the Excel-style column letter for a 1-based index."""
-        result = ""
-        while index:
-            index, remainder = divmod(index - 1, 26)
-            result = chr(65 + remainder) + result
-        return result
+    def _append_cells_request(worksheet: Worksheet, rows: Sequence[List[Any]]) -> Dict[str, Any]:
+        return {
+            "appendCells": {
+                "sheetId": worksheet.id,
+                "rows": [
+                    {"values": [_user_entered_cell(cell) for cell in row]}
+                    for row in rows
+                ],
+                "fields": "userEnteredValue",
+            }
+        }
+
+    def _index_appended_rows(
+        self, worksheet: Worksheet, response: Any, rows: Sequence[List[Any]]
+    ) -> None:
+        """Record freshly appended rows in any cached column index."""
+        updated_range = ""
+        if isinstance(response, dict):
+            updated_range = response.get("updates", {}).get("updatedRange", "")
+        match = _UPDATED_ROW_RE.search(updated_range)
+
+        for column_index in (ID_COLUMN, USER_EMAIL_COLUMN):
+            key = (worksheet.title, column_index)
+            index = self._row_indexes.get(key)
+            if index is None:
+                continue
+            if match is None:
+                self._row_indexes.pop(key)
+                continue
+            first_row = int(match.group(1))
+            for offset, row in enumerate(rows):
+                if column_index <= len(row):
+                    index.setdefault(str(row[column_index - 1]), first_row + offset)
@@ -0,0 +1,101 @@
+from __future__ import annotations
+
+import asyncio
+from typing import Any, Awaitable, Callable, Generic, List, Optional, Tuple, TypeVar
+
+T = TypeVar("T")
+
+# runs a blocking callable off the event loop, e.g. SheetsRepository.run
+Runner = Callable[..., Awaitable[Any]]
+
+DEFAULT_MAX_BATCH = 50
+
+_STOP: Any = object()
+
+
+class WriteBuffer(Generic[T]):
+    """Coalesce concurrent writes into one blocking bulk call per flush.
+
+    A background task writes whatever is queued as soon as the previous
+    flush finishes, so an idle buffer adds no latency while writes that
+    arrive during an in-flight Sheets request share the next one. Callers
+    await submit() until their own item is written, keeping read-your-writes.
+    """
+
+    def __init__(
+        self,
+        flush: Callable[[List[T]], None],
+        *,
+        max_batch: int = DEFAULT_MAX_BATCH,
+        run: Runner = asyncio.to_thread,
+    ) -> None:
+        if max_batch <= 0:
+            raise ValueError("max_batch must be positive.")
+
+        self._flush = flush
+        self._max_batch = max_batch
+        self._run_blocking = run
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self) -> None:
+        """Start the background flush task on the running event loop."""
+        if self._task is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """Write anything still queued, then stop the background task."""
+        if self._task is None or self._queue is None:
+            return
+        await self._queue.put(_STOP)
+        await self._task
+        self._task = None
+        self._queue = None
+
+    async def submit(self, item: T) -> None:
+        """Queue an item and wait until it has been written."""
+        if self._task is None or self._queue is None:
+            # not started (e.g. outside the app lifespan): write directly
+            await self._run_blocking(self._flush, [item])
+            return
+
+        future: asyncio.Future = asyncio.get_running_loop().create_future()
+        await self._queue.put((item, future))
+        await future
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        while True:
+            entry = await self._queue.get()
+            if entry is _STOP:
+                return
+
+            batch: List[Tuple[T, asyncio.Future]] = [entry]
+            stopping = False
+            while len(batch) < self._max_batch:
+                try:
+                    entry = self._queue.get_nowait()
+                except asyncio.QueueEmpty:
+                    break
+                if entry is _STOP:
+                    stopping = True
+                    break
+                batch.append(entry)
+
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: List[Tuple[T, asyncio.Future]]) -> None:
+        try:
+            await self._run_blocking(self._flush, [item for item, _ in batch])
+        except Exception as exc:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+        else:
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(None)
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import string
 from datetime import datetime
 from enum import Enum
 from typing import List
@@ -10,8 +11,22 @@ from pydantic import BaseModel, Field, field_validator
 KEYWORD_MIN = 1
 KEYWORD_MAX = 7
 
+# deletes every character an already-normalized keyword list may contain
+_KEYWORD_CHARS = str.maketrans("", "", string.ascii_lowercase + string.digits + "_-,")
+
 
 def _normalize_keywords(value: str) -> str:
+    # single C-level pass for the common, already-normalized case
+    if (
+        value
+        and not value.translate(_KEYWORD_CHARS)
+        and value.count(",") <= KEYWORD_MAX - 1
+        and value[0] != ","
+        and value[-1] != ","
+        and ",," not in value
+    ):
+        return value
+
     tokens: List[str] = [token.strip() for token in value.split(",") if token.strip()]
     if not (KEYWORD_MIN <= len(tokens) <= KEYWORD_MAX):
         raise ValueError(
@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import re
 from datetime import datetime
 from enum import Enum
 from typing import List
@@ -22,7 +23,24 @@ NOISE_VALUES = {"noise_quiet", "noise_moderate", "noise_noisy"}
 CROWD_VALUES = {"crowd_alone", "crowd_few", "crowd_many"}
 
 
+def _alternation(values: set[str]) -> str:
+    return "|".join(sorted(values))
+
+
+# one pass over well-formed input; anything else falls through to the
+# token checks below for the precise error message
+_ENVIRONMENT_RE = re.compile(
+    rf"\s*({_alternation(LOCATION_VALUES)})\s*,"
+    rf"\s*({_alternation(NOISE_VALUES)})\s*,"
+    rf"\s*({_alternation(CROWD_VALUES)})\s*"
+)
+
+
 def _normalize_environment(value: str) -> str:
+    match = _ENVIRONMENT_RE.fullmatch(value)
+    if match is not None:
+        return ",".join(match.groups())
+
     tokens: List[str] = [token.strip() for token in value.split(",") if token.strip()]
     if len(tokens) != 3:
         raise ValueError("Environment must contain exactly three tokens.")
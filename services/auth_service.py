@@ -2,42 +2,55 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from uuid import UUID, uuid4
+import asyncio
+from typing import Optional
 
+from common.cache import TTLCache
 from common.errors import NotFoundError, ValidationError
+from common.ids import new_uuid4
 from common.jwt_utils import create_access_token
 from common.security import hash_password, verify_password
-from common.time_utils import from_isoformat, to_isoformat, utc_now
-from repositories.sheets_repo import SheetsRepository
-from schemas.auth import AuthTokens, UserLoginRequest, UserOut, UserRegisterRequest, UserRole
+from common.time_utils import utc_now_with_iso
+from repositories.sheets_repo import SheetsRepository, UserRow
+from schemas.auth import AuthTokens, UserLoginRequest, UserOut, UserRegisterRequest
+from services.row_models import user_out_from_row
 
 
 class AuthService:
-    def __init__(self, repository: SheetsRepository) -> None:
+    def __init__(
+        self,
+        repository: SheetsRepository,
+        *,
+        user_cache: Optional[TTLCache[str, UserOut]] = None,
+    ) -> None:
         self._repository = repository
+        # cache of authenticated users kept by the API layer; evicted on writes
+        self._user_cache = user_cache
 
     async def register(self, payload: UserRegisterRequest) -> AuthTokens:
-        existing = self._repository.get_user_by_email(payload.email)
+        # repository calls are blocking gspread I/O; keep them off the event loop
+        existing = await self._repository.run(self._repository.get_user_by_email, payload.email)
         if existing is not None:
             raise ValidationError("Email is already registered.")
 
-        user_id = uuid4()
-        now = utc_now()
-        iso_now = to_isoformat(now)
+        # bcrypt is deliberately slow CPU work; run it in a worker thread
+        password_hash = await asyncio.to_thread(hash_password, payload.password)
+
+        user_id = new_uuid4()
+        _, iso_now = utc_now_with_iso()
 
         record = {
             "user_id": str(user_id),
             "email": payload.email,
-            "password_hash": hash_password(payload.password),
+            "password_hash": password_hash,
             "full_name": payload.full_name,
             "role": payload.role.value,
             "created_at": iso_now,
             "updated_at": iso_now,
             "last_login_at": iso_now,
         }
-        self._repository.create_user(record)
-        user_out = self._build_user_out(record)
+        await self._repository.run(self._repository.create_user, record)
+        user_out = user_out_from_row(UserRow(**record))
         token = create_access_token(
             user_id=user_out.user_id.hex,
             email=user_out.email,
@@ -46,20 +59,24 @@ class AuthService:
         return AuthTokens(access_token=token, user=user_out)
 
     async def login(self, payload: UserLoginRequest) -> AuthTokens:
-        record = self._repository.get_user_by_email(payload.email)
+        record = await self._repository.run(self._repository.get_user_by_email, payload.email)
         if record is None:
             raise NotFoundError("User not found.")
 
-        if not verify_password(payload.password, record["password_hash"]):
+        if not await asyncio.to_thread(
+            verify_password, payload.password, record.password_hash
+        ):
             raise ValidationError("Invalid credentials.")
 
-        now = utc_now()
-        iso_now = to_isoformat(now)
-        updated_record = self._repository.update_user(
-            record["user_id"], {"last_login_at": iso_now, "updated_at": iso_now}
+        _, iso_now = utc_now_with_iso()
+        updated_record = await self._repository.run(
+            self._repository.update_user,
+            record.user_id,
+            {"last_login_at": iso_now, "updated_at": iso_now},
         )
+        self._invalidate_cached_user(record.user_id)
 
-        user_out = self._build_user_out(updated_record)
+        user_out = user_out_from_row(updated_record)
         token = create_access_token(
             user_id=user_out.user_id.hex,
             email=user_out.email,
@@ -67,15 +84,6 @@ class AuthService:
         )
         return AuthTokens(access_token=token, user=user_out)
 
-    def _build_user_out(self, record: dict) -> UserOut:
-        return UserOut(
-            user_id=UUID(record["user_id"]),
-            email=record["email"],
-            full_name=record["full_name"],
-            role=UserRole(record["role"]),
-            created_at=from_isoformat(record["created_at"]),
-            updated_at=from_isoformat(record["updated_at"]),
-            last_login_at=from_isoformat(record["last_login_at"])
-            if record.get("last_login_at")
-            else None,
-        )
+    def _invalidate_cached_user(self, user_id: str) -> None:
+        if self._user_cache is not None:
+            self._user_cache.pop(user_id)
@@ -1,42 +1,70 @@
 from __future__ import annotations
 
-import asyncio
-from typing import Dict, List, Sequence
-from uuid import UUID, uuid4
+from typing import Any, Dict, List, Optional, Tuple
+from uuid import UUID
 
+from common.cache import TTLCache
+from common.errors import NotFoundError
+from common.ids import new_uuid4
 from common.keyword_processor import KeywordRequest
 from common.openai_client import OpenAIClient
-from common.time_utils import from_isoformat, to_isoformat, utc_now
-from repositories.sheets_repo import SheetsRepository
+from common.time_utils import from_isoformat, utc_now_with_iso
+from repositories.sheets_repo import ChildRow, SheetsRepository
+from repositories.write_buffer import WriteBuffer
 from schemas.children import (
     ChildCreate,
     ChildCreateResponse,
     ChildDetail,
-    ChildSummary,
     ChildrenListResponse,
-    CommunicationLevel,
-    PersonalityType,
 )
+from services.row_models import child_detail_from_row, child_summary_from_row
+
+# keyword columns generated per child, in the order create_child passes the raw notes
+_KEYWORD_LABELS = ("triggers", "interests", "target_skills")
+
+CHILD_DETAIL_CACHE_MAXSIZE = 1024
+CHILD_DETAIL_CACHE_TTL_SECONDS = 300.0
+
+
+def new_child_detail_cache() -> TTLCache[str, ChildDetail]:
+    """child_id -> parsed ChildDetail, shared by the children and sessions services."""
+    return TTLCache(maxsize=CHILD_DETAIL_CACHE_MAXSIZE, ttl=CHILD_DETAIL_CACHE_TTL_SECONDS)
 
 
 class ChildrenService:
     """Coordinates keyword generation and Sheets persistence for child profiles."""
 
-    def __init__(self, repository: SheetsRepository, openai_client: OpenAIClient) -> None:
+    def __init__(
+        self,
+        repository: SheetsRepository,
+        openai_client: OpenAIClient,
+        *,
+        child_writer: Optional[WriteBuffer[Tuple[Dict[str, Any], Dict[str, Any]]]] = None,
+        child_cache: Optional[TTLCache[str, ChildDetail]] = None,
+    ) -> None:
         self._repository = repository
         self._openai = openai_client
+        # coalesces concurrent (child, link) writes into one batchUpdate call
+        self._child_writer = child_writer or WriteBuffer(
+            repository.create_children_and_links_bulk, run=repository.run
+        )
+        self._child_cache = child_cache if child_cache is not None else new_child_detail_cache()
 
     async def create_child(self, payload: ChildCreate, user_id: UUID) -> ChildCreateResponse:
         """Create a new child profile and persist it to Google Sheets."""
-        child_uuid = uuid4()
-        now = utc_now()
-        iso_now = to_isoformat(now)
-
-        keyword_requests: Sequence[KeywordRequest] = (
-            KeywordRequest(label="triggers", raw_text=payload.triggers_raw),
-            KeywordRequest(label="interests", raw_text=payload.interests_raw),
-            KeywordRequest(label="target_skills", raw_text=payload.target_skills_raw),
+        child_uuid = new_uuid4()
+        now, iso_now = utc_now_with_iso()
+
+        keyword_requests = tuple(
+            map(
+                KeywordRequest,
+                _KEYWORD_LABELS,
+                (payload.triggers_raw, payload.interests_raw, payload.target_skills_raw),
+            )
         )
+        # the row is written only once keywords exist: a placeholder insert plus a
+        # keyword update would cost an extra Sheets write and leave half-built rows
+        # behind when generation fails
         keywords = await self._openai.generate_keywords(keyword_requests)
 
         record: Dict[str, str] = {
@@ -55,15 +83,33 @@ class ChildrenService:
             "updated_at": iso_now,
         }
 
-        # offload synchronous Sheets write to a thread to avoid blocking
-        await asyncio.to_thread(self._repository.create_child, record)
-        await asyncio.to_thread(
-            self._repository.link_user_child,
-            {
-                "user_id": str(user_id),
-                "child_id": str(child_uuid),
-                "created_at": iso_now,
-            },
+        link_record = {
+            "user_id": str(user_id),
+            "child_id": str(child_uuid),
+            "created_at": iso_now,
+        }
+        # child row and ownership link are written together in one atomic request
+        await self._child_writer.submit((record, link_record))
+        # cache on write: the first session for this child skips the Sheets read;
+        # timestamps match the stored second-precision value, not the in-memory `now`
+        stored_at = from_isoformat(iso_now)
+        self._child_cache.set(
+            str(child_uuid),
+            ChildDetail(
+                child_id=child_uuid,
+                nickname=payload.nickname,
+                age=payload.age,
+                comm_level=payload.comm_level,
+                personality=payload.personality,
+                triggers_raw=payload.triggers_raw,
+                triggers=keywords["triggers"],
+                interests_raw=payload.interests_raw,
+                interests=keywords["interests"],
+                target_skills_raw=payload.target_skills_raw,
+                target_skills=keywords["target_skills"],
+                created_at=stored_at,
+                updated_at=stored_at,
+            ),
         )
 
         return ChildCreateResponse(
@@ -79,53 +125,39 @@ class ChildrenService:
 
     async def get_child(self, child_id: UUID, user_id: UUID | None = None) -> ChildDetail:
         """Retrieve a stored child profile."""
-        if user_id is not None:
-            owns = await asyncio.to_thread(
+        cached = self._child_cache.get(str(child_id))
+        record: Optional[ChildRow] = None
+        if user_id is not None and cached is not None:
+            owns = await self._repository.run(
                 self._repository.user_owns_child, str(user_id), str(child_id)
             )
             if not owns:
                 raise NotFoundError("Child not found for current user.")
+        elif user_id is not None:
+            # ownership and the row come back from a single batchGet
+            owns, record = await self._repository.run(
+                self._repository.fetch_child_with_ownership, str(user_id), str(child_id)
+            )
+            if not owns:
+                raise NotFoundError("Child not found for current user.")
+            if record is None:
+                raise NotFoundError(
+                    f"Child '{child_id}' not found.", details={"child_id": str(child_id)}
+                )
 
-        record = await asyncio.to_thread(self._repository.get_child, str(child_id))
-
-        # Convert ISO-8601 string into datetime
-        created_at = from_isoformat(record["created_at"])
-        updated_at = from_isoformat(record["updated_at"])
-
-        return ChildDetail(
-            child_id=UUID(record["child_id"]),
-            nickname=record["nickname"],
-            age=int(record["age"]) if isinstance(record["age"], str) else record["age"],
-            comm_level=CommunicationLevel(record["comm_level"]),
-            personality=PersonalityType(record["personality"]),
-            triggers_raw=record["triggers_raw"],
-            triggers=record["triggers"],
-            interests_raw=record["interests_raw"],
-            interests=record["interests"],
-            target_skills_raw=record["target_skills_raw"],
-            target_skills=record["target_skills"],
-            created_at=created_at,
-            updated_at=updated_at,
-        )
+        if cached is not None:
+            return cached
+
+        if record is None:
+            record = await self._repository.run(self._repository.get_child, str(child_id))
+
+        detail = child_detail_from_row(record)
+        self._child_cache.set(str(child_id), detail)
+        return detail
 
     async def list_children_for_user(self, user_id: UUID) -> ChildrenListResponse:
-        records: List[Dict[str, Any]] = await asyncio.to_thread(
+        records: List[ChildRow] = await self._repository.run(
             self._repository.list_children_for_user, str(user_id)
         )
-        summaries: List[ChildSummary] = []
-        for record in records:
-            summaries.append(
-                ChildSummary(
-                    child_id=UUID(record["child_id"]),
-                    nickname=record["nickname"],
-                    age=int(record["age"]) if isinstance(record["age"], str) else record["age"],
-                    comm_level=CommunicationLevel(record["comm_level"]),
-                    personality=PersonalityType(record["personality"]),
-                    triggers=record["triggers"],
-                    interests=record["interests"],
-                    target_skills=record["target_skills"],
-                    created_at=from_isoformat(record["created_at"]),
-                    updated_at=from_isoformat(record["updated_at"]),
-                )
-            )
-        return ChildrenListResponse(children=summaries)
+        summaries = [child_summary_from_row(record) for record in records]
+        return ChildrenListResponse.model_construct(children=summaries)
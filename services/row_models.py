@@ -0,0 +1,64 @@
+"""Build API models from rows read from, or just written to, our own sheets.
+
+Every row here was validated on the way in, so the models are built with
+model_construct and skip a second pydantic validation pass.
+"""
+
+from __future__ import annotations
+
+from typing import Dict
+from uuid import UUID
+
+from common.time_utils import from_isoformat
+from repositories.sheets_repo import ChildRow, UserRow
+from schemas.auth import UserOut, UserRole
+from schemas.children import ChildDetail, ChildSummary, CommunicationLevel, PersonalityType
+
+# value -> member lookups; plain dict hits instead of Enum.__call__ per row
+_COMM_LEVELS: Dict[str, CommunicationLevel] = {level.value: level for level in CommunicationLevel}
+_PERSONALITIES: Dict[str, PersonalityType] = {kind.value: kind for kind in PersonalityType}
+
+
+def user_out_from_row(record: UserRow) -> UserOut:
+    return UserOut.model_construct(
+        user_id=UUID(record.user_id),
+        email=record.email,
+        full_name=record.full_name,
+        role=UserRole(record.role),
+        created_at=from_isoformat(record.created_at),
+        updated_at=from_isoformat(record.updated_at),
+        last_login_at=from_isoformat(record.last_login_at) if record.last_login_at else None,
+    )
+
+
+def child_detail_from_row(record: ChildRow) -> ChildDetail:
+    return ChildDetail.model_construct(
+        child_id=UUID(record.child_id),
+        nickname=record.nickname,
+        age=record.age,
+        comm_level=_COMM_LEVELS[record.comm_level],
+        personality=_PERSONALITIES[record.personality],
+        triggers_raw=record.triggers_raw,
+        triggers=record.triggers,
+        interests_raw=record.interests_raw,
+        interests=record.interests,
+        target_skills_raw=record.target_skills_raw,
+        target_skills=record.target_skills,
+        created_at=from_isoformat(record.created_at),
+        updated_at=from_isoformat(record.updated_at),
+    )
+
+
+def child_summary_from_row(record: ChildRow) -> ChildSummary:
+    return ChildSummary.model_construct(
+        child_id=UUID(record.child_id),
+        nickname=record.nickname,
+        age=record.age,
+        comm_level=_COMM_LEVELS[record.comm_level],
+        personality=_PERSONALITIES[record.personality],
+        triggers=record.triggers,
+        interests=record.interests,
+        target_skills=record.target_skills,
+        created_at=from_isoformat(record.created_at),
+        updated_at=from_isoformat(record.updated_at),
+    )
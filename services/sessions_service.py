@@ -2,15 +2,19 @@
 
 from __future__ import annotations
 
-import asyncio
-from typing import Iterable, List
-from uuid import UUID, uuid4
+from typing import Any, Dict, Iterable, Optional
+from uuid import UUID
 
+from common.cache import TTLCache
 from common.openai_client import OpenAIClient
 from common.errors import NotFoundError
-from common.time_utils import from_isoformat, to_isoformat, utc_now
+from common.ids import new_uuid4
+from common.time_utils import from_isoformat, utc_now_with_iso
 from repositories.sheets_repo import SheetsRepository
-from schemas.children import ChildDetail, CommunicationLevel, PersonalityType
+from repositories.write_buffer import WriteBuffer
+from services.children_service import new_child_detail_cache
+from services.row_models import child_detail_from_row
+from schemas.children import ChildDetail
 from schemas.sessions import (
     LatestSessionResponse,
     SessionCreate,
@@ -29,9 +33,21 @@ class SessionsService:
         "Do not speak directly to the child. Produce a single cohesive system prompt for the robot to follow."
     )
 
-    def __init__(self, repository: SheetsRepository, openai_client: OpenAIClient) -> None:
+    def __init__(
+        self,
+        repository: SheetsRepository,
+        openai_client: OpenAIClient,
+        *,
+        session_writer: Optional[WriteBuffer[Dict[str, Any]]] = None,
+        child_cache: Optional[TTLCache[str, ChildDetail]] = None,
+    ) -> None:
         self._repository = repository
         self._openai = openai_client
+        # coalesces concurrent session appends into one append_rows call
+        self._session_writer = session_writer or WriteBuffer(
+            repository.create_sessions_bulk, run=repository.run
+        )
+        self._child_cache = child_cache if child_cache is not None else new_child_detail_cache()
 
     async def create_session(
         self,
@@ -39,16 +55,13 @@ class SessionsService:
         user_id: UUID,
     ) -> SessionCreateResponse:
         """Create a new session, generate prompt, and persist the record."""
-        owns = await asyncio.to_thread(
+        owns = await self._repository.run(
             self._repository.user_owns_child, str(user_id), str(payload.child_id)
         )
         if not owns:
             raise NotFoundError("Child not found for current user.")
 
-        child_record = await asyncio.to_thread(
-            self._repository.get_child, str(payload.child_id)
-        )
-        child_profile = self._hydrate_child(child_record)
+        child_profile = await self._get_child_profile(payload.child_id)
 
         prompt_messages = self._build_prompt_messages(child_profile, payload)
         prompt_text = await self._openai.generate_prompt(
@@ -56,9 +69,8 @@ class SessionsService:
             template_messages=prompt_messages,
         )
 
-        session_uuid = uuid4()
-        now = utc_now()
-        iso_now = to_isoformat(now)
+        session_uuid = new_uuid4()
+        now, iso_now = utc_now_with_iso()
 
         record = {
             "session_id": str(session_uuid),
@@ -70,7 +82,7 @@ class SessionsService:
             "created_at": iso_now,
         }
 
-        await asyncio.to_thread(self._repository.create_session, record)
+        await self._session_writer.submit(record)
 
         return SessionCreateResponse(
             session_id=session_uuid,
@@ -80,84 +92,74 @@ class SessionsService:
 
     async def get_session(self, session_id: UUID) -> SessionDetail:
         """Retrieve a stored session record."""
-        record = await asyncio.to_thread(self._repository.get_session, str(session_id))
+        record = await self._repository.run(self._repository.get_session, str(session_id))
 
         return SessionDetail(
-            session_id=UUID(record["session_id"]),
-            child_id=UUID(record["child_id"]),
-            mood=SessionMood(record["mood"]),
-            environment=record["environment"],
-            situation=record["situation"],
-            prompt=record["prompt"],
-            created_at=from_isoformat(record["created_at"]),
-        )
-    
-    # Convert the sheet dict to ChildDetail
-    def _hydrate_child(self, record: dict) -> ChildDetail:
-        return ChildDetail(
-            child_id=UUID(record["child_id"]),
-            nickname=record["nickname"],
-            age=int(record["age"]) if isinstance(record["age"], str) else record["age"],
-            comm_level=CommunicationLevel(record["comm_level"]),
-            personality=PersonalityType(record["personality"]),
-            triggers_raw=record["triggers_raw"],
-            triggers=record["triggers"],
-            interests_raw=record["interests_raw"],
-            interests=record["interests"],
-            target_skills_raw=record["target_skills_raw"],
-            target_skills=record["target_skills"],
-            created_at=from_isoformat(record["created_at"]),
-            updated_at=from_isoformat(record["updated_at"]),
+            session_id=UUID(record.session_id),
+            child_id=UUID(record.child_id),
+            mood=SessionMood(record.mood),
+            environment=record.environment,
+            situation=record.situation,
+            prompt=record.prompt,
+            created_at=from_isoformat(record.created_at),
         )
     
+    async def _get_child_profile(self, child_id: UUID) -> ChildDetail:
+        cached = self._child_cache.get(str(child_id))
+        if cached is not None:
+            return cached
+
+        record = await self._repository.run(self._repository.get_child, str(child_id))
+        child_profile = child_detail_from_row(record)
+        self._child_cache.set(str(child_id), child_profile)
+        return child_profile
+
     # Child's profile + The day's session
     def _build_prompt_messages(
         self, child: ChildDetail, payload: SessionCreate
     ) -> Iterable[dict]:
-        profile_lines = [
-            f"Nickname: {child.nickname}",
-            f"Age: {child.age}",
-            f"Communication level: {child.comm_level.value}",
-            f"Personality: {child.personality.value}",
-            f"Long-term interests: {child.interests}",
-            f"Sensitivities to avoid: {child.triggers}",
-            f"Target social skills: {child.target_skills}",
-        ]
-
-        session_lines = [
-            f"Mood today: {payload.mood.value}",
-            f"Environment tags: {payload.environment}",
-            f"Situation notes: {payload.situation}",
-        ]
-
-        profile_text = "Child profile:\n" + "\n".join(f"- {line}" for line in profile_lines)
-        session_text = "Today's context:\n" + "\n".join(f"- {line}" for line in session_lines)
-
-        messages: List[dict] = [
+        # fixed shape, so a single f-string per message instead of list + join
+        profile_text = (
+            "Child profile:\n"
+            f"- Nickname: {child.nickname}\n"
+            f"- Age: {child.age}\n"
+            f"- Communication level: {child.comm_level.value}\n"
+            f"- Personality: {child.personality.value}\n"
+            f"- Long-term interests: {child.interests}\n"
+            f"- Sensitivities to avoid: {child.triggers}\n"
+            f"- Target social skills: {child.target_skills}"
+        )
+        session_text = (
+            "Today's context:\n"
+            f"- Mood today: {payload.mood.value}\n"
+            f"- Environment tags: {payload.environment}\n"
+            f"- Situation notes: {payload.situation}"
+        )
+
+        return (
             {"role": "user", "content": profile_text},
             {"role": "user", "content": session_text},
-        ]
-        return messages
+        )
 
     async def get_latest_session(self, user_id: UUID, child_id: UUID) -> LatestSessionResponse | None:
-        owns = await asyncio.to_thread(
+        owns = await self._repository.run(
             self._repository.user_owns_child, str(user_id), str(child_id)
         )
         if not owns:
             raise NotFoundError("Child not found for current user.")
 
-        record = await asyncio.to_thread(
+        record = await self._repository.run(
             self._repository.get_latest_session_for_child, str(child_id)
         )
         if record is None:
             return None
 
         return LatestSessionResponse(
-            session_id=UUID(record["session_id"]),
-            child_id=UUID(record["child_id"]),
-            mood=SessionMood(record["mood"]),
-            environment=record["environment"],
-            situation=record["situation"],
-            prompt=record["prompt"],
-            created_at=from_isoformat(record["created_at"]),
+            session_id=UUID(record.session_id),
+            child_id=UUID(record.child_id),
+            mood=SessionMood(record.mood),
+            environment=record.environment,
+            situation=record.situation,
+            prompt=record.prompt,
+            created_at=from_isoformat(record.created_at),
         )